@@ -1,4 +1,91 @@
+const ACTIVE_CLASS = 'is-active-link';
+const COLLAPSED_CLASS = 'is-collapsed';
+const SPY_OFFSET = 80; // px, below the topbar
+
+/* Sub-list of the top level TOC item that contains the link, same as tocbot's `collapseDepth: 0` */
+function sectionList(link) {
+  if (link === null) {
+    return null;
+  }
+  const item = link.closest('#toc > .toc-list > .toc-list-item');
+  return item === null ? null : item.querySelector('.is-collapsible');
+}
+
+/**
+ * Highlight the current section of TOC rendered at build time (see `_includes/toc.html`).
+ * Only headings referenced by the TOC links are looked up, the content is never scanned.
+ */
+function spyStaticToc(links) {
+  const targets = [];
+  links.forEach((link) => {
+    const heading = document.getElementById(decodeURIComponent(link.hash.substring(1)));
+    if (heading !== null) {
+      targets.push({ link, heading });
+    }
+  });
+
+  let active = null;
+  let expanded = null;
+  let ticking = false;
+
+  function update() {
+    ticking = false;
+
+    let current = null;
+    for (const target of targets) {
+      if (target.heading.getBoundingClientRect().top > SPY_OFFSET) {
+        break;
+      }
+      current = target.link;
+    }
+
+    if (current !== active) {
+      if (active !== null) {
+        active.classList.remove(ACTIVE_CLASS);
+      }
+      if (current !== null) {
+        current.classList.add(ACTIVE_CLASS);
+      }
+      active = current;
+
+      const section = sectionList(current);
+      if (section !== expanded) {
+        if (expanded !== null) {
+          expanded.classList.add(COLLAPSED_CLASS);
+        }
+        if (section !== null) {
+          section.classList.remove(COLLAPSED_CLASS);
+        }
+        expanded = section;
+      }
+    }
+  }
+
+  window.addEventListener(
+    'scroll',
+    () => {
+      if (!ticking) {
+        ticking = true;
+        window.requestAnimationFrame(update);
+      }
+    },
+    { passive: true }
+  );
+
+  update();
+}
+
 export function toc() {
+  const staticLinks = document.querySelectorAll('#toc .toc-link');
+  if (staticLinks.length > 0) {
+    spyStaticToc(Array.from(staticLinks));
+    return;
+  }
+
+  if (typeof tocbot === 'undefined') {
+    return;
+  }
+
   if (document.querySelector('#core-wrapper h2,#core-wrapper h3')) {
     // see: https://github.com/tscanlin/tocbot#usage
     tocbot.init({
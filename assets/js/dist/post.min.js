@@ -3,4 +3,4 @@
  * © 2019 Cotes Chung
  * MIT Licensed
  */
-!function(){"use strict";function t(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}function e(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,i(n.key),n)}}function r(t,r,n){return r&&e(t.prototype,r),n&&e(t,n),Object.defineProperty(t,"prototype",{writable:!1}),t}function n(t,e,r){return(e=i(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function o(t){return function(t){if(Array.isArray(t))return a(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);"Object"===r&&t.constructor&&(r=t.constructor.name);if("Map"===r||"Set"===r)return Array.from(t);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return a(t,e)}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function i(t){var e=function(t,e){if("object"!=typeof t||null===t)return t;var r=t[Symbol.toPrimitive];if(void 0!==r){var n=r.call(t,e||"default");if("object"!=typeof n)return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===e?String:Number)(t)}(t,"string");return"symbol"==typeof e?e:String(e)}var c=$(".mode-toggle");var l=$("body"),s="sidebar-display",u=function(){function e(){t(this,e)}return r(e,null,[{key:"toggle",value:function(){!1===e.isExpanded?l.attr(s,""):l.removeAttr(s),e.isExpanded=!e.isExpanded}}]),e}();n(u,"isExpanded",!1);var f=$("#sidebar-trigger"),p=$("#search-trigger"),d=$("#search-cancel"),m=$("#main>.row"),g=$("#topbar-title"),v=$("#search-wrapper"),h=$("#search-result-wrapper"),y=$("#search-results"),b=$("#search-input"),w=$("#search-hints"),C=$("html,body"),S=$("#lang-sec-center"),k="loaded",E="unloaded",T="input-focus",x="d-flex",P=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){e.offset=window.scrollY,C.scrollTop(0)}},{key:"off",value:function(){C.scrollTop(e.offset)}}]),e}();n(P,"offset",0),n(P,"resultVisible",!1);var _=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){f.addClass(E),g.addClass(E),p.addClass(E),v.addClass(x),d.addClass(k),S.addClass(E)}},{key:"off",value:function(){d.removeClass(k),v.removeClass(x),f.removeClass(E),g.removeClass(E),p.removeClass(E),S.removeClass(E)}}]),e}(),A=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){P.resultVisible||(P.on(),h.removeClass(E),m.addClass(E),P.resultVisible=!0)}},{key:"off",value:function(){P.resultVisible&&(y.empty(),w.hasClass(E)&&w.removeClass(E),h.addClass(E),m.removeClass(E),P.off(),b.val(""),P.resultVisible=!1)}}]),e}();function I(){return d.hasClass(k)}$(".collapse");var j=".code-header>button",K="fas fa-check",O="timeout",V="data-title-succeed",Y="data-bs-original-title",F=2e3;function N(t){if($(t)[0].hasAttribute(O)){var e=$(t).attr(O);if(Number(e)>Date.now())return!0}return!1}function L(t){$(t).attr(O,Date.now()+F)}function M(t){$(t).removeAttr(O)}var R=$(j).children().attr("class");var D=function(){function e(){t(this,e)}return r(e,null,[{key:"attrTimestamp",get:function(){return"data-ts"}},{key:"attrDateFormat",get:function(){return"data-df"}},{key:"locale",get:function(){return $("html").attr("lang").substring(0,2)}},{key:"getTimestamp",value:function(t){return Number(t.attr(e.attrTimestamp))}},{key:"getDateFormat",value:function(t){return t.attr(e.attrDateFormat)}}]),e}();var J,q=(J=!1,function(){var t=J;return J||(J=!0),t}),z=function(){function t(t){return $(t).attr("content")}function e(e){var r=t(e);return void 0!==r&&!1!==r}return{getProxyMeta:function(){return t("meta[name=pv-proxy-endpoint]")},getLocalMeta:function(){return t("meta[name=pv-cache-path]")},hasProxyMeta:function(){return e("meta[name=pv-proxy-endpoint]")},hasLocalMeta:function(){return e("meta[name=pv-cache-path]")}}}(),U=function(){var t={KEY_PV:"pv",KEY_PV_SRC:"pv_src",KEY_CREATION:"pv_created_date"},e="same-origin",r="cors";function n(t){return localStorage.getItem(t)}function o(t,e){localStorage.setItem(t,e)}function a(e,r){o(t.KEY_PV,e),o(t.KEY_PV_SRC,r),o(t.KEY_CREATION,(new Date).toJSON())}return{keysCount:function(){return Object.keys(t).length},hasCache:function(){return null!==localStorage.getItem(t.KEY_PV)},getCache:function(){return JSON.parse(localStorage.getItem(t.KEY_PV))},saveLocalCache:function(t){a(t,e)},saveProxyCache:function(t){a(t,r)},isExpired:function(){var e=new Date(n(t.KEY_CREATION));return e.setHours(e.getHours()+1),Date.now()>=e.getTime()},isFromLocal:function(){return n(t.KEY_PV_SRC)===e},isFromProxy:function(){return n(t.KEY_PV_SRC)===r},newerThan:function(t){return U.getCache().totalsForAllResults["ga:pageviews"]>t.totalsForAllResults["ga:pageviews"]},inspectKeys:function(){if(localStorage.length===U.keysCount())for(var e=0;e<localStorage.length;e++){switch(localStorage.key(e)){case t.KEY_PV:case t.KEY_PV_SRC:case t.KEY_CREATION:break;default:return void localStorage.clear()}}else localStorage.clear()}}}();function H(t,e,r,n){var o=function(t,e){var r=0;if(void 0!==e)for(var n=0;n<e.length;++n)if(e[parseInt(n,10)][0]===t){r+=parseInt(e[parseInt(n,10)][1],10);break}return r}(e,t);if(o=0===o?1:o,n){var a=parseInt(r.text().replace(/,/g,""),10);o>a&&function(t,e,r){if(t<e){var n=new CountUp(r,t,e);n.error?console.error(n.error):n.start()}}(a,o,r.attr("id"))}else r.text((new Intl.NumberFormat).format(o))}function B(t){if(void 0!==t){var e=q(),r=t.rows;if($(".post").length>0)H(r,window.location.pathname,$("#pv"),e)}}function G(){z.hasProxyMeta()&&$.ajax({type:"GET",url:z.getProxyMeta(),dataType:"jsonp",success:function(t){B(t),U.saveProxyCache(JSON.stringify(t))},error:function(t,e,r){console.log("Failed to load pageviews from proxy server: "+r)}})}function Q(){var t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return fetch(z.getLocalMeta()).then((function(t){return t.json()})).then((function(e){t&&U.isFromProxy()&&U.newerThan(e)||(B(e),U.saveLocalCache(JSON.stringify(e)))}))}$(window).on("scroll",(function(){$(window).scrollTop()>50?$("#back-to-top").fadeIn():$("#back-to-top").fadeOut()})),$("#back-to-top").on("click",(function(){window.scrollTo(0,0)})),o(document.querySelectorAll('[data-bs-toggle="tooltip"]')).map((function(t){return new bootstrap.Tooltip(t)})),0!==c.length&&c.off().on("click",(function(t){var e=$(t.target),r=e.prop("tagName")==="button".toUpperCase()?e:e.parent();modeToggle.flipMode(),r.trigger("blur")})),$("#sidebar-trigger").on("click",u.toggle),$("#mask").on("click",u.toggle),p.on("click",(function(){console.log("dsgdfgd"),_.on(),A.on(),b.trigger("focus")})),d.on("click",(function(){_.off(),A.off()})),b.on("focus",(function(){v.addClass(T)})),b.on("focusout",(function(){v.removeClass(T)})),b.on("input",(function(){""===b.val()?I()?w.removeClass(E):A.off():(A.on(),I()&&w.addClass(E))})),$("#core-wrapper img[data-src]")<=0||document.addEventListener("lazyloaded",(function(t){$(t.target).parent().removeClass("shimmer")})),$(".popup")<=0||$(".popup").magnificPopup({type:"image",closeOnContentClick:!0,showCloseBtn:!1,zoom:{enabled:!0,duration:300,easing:"ease-in-out"}}),dayjs.locale(D.locale),dayjs.extend(window.dayjs_plugin_localizedFormat),$("[".concat(D.attrTimestamp,"]")).each((function(){var t=dayjs.unix(D.getTimestamp($(this))),e=t.format(D.getDateFormat($(this)));$(this).text(e),$(this).removeAttr(D.attrTimestamp),$(this).removeAttr(D.attrDateFormat);var r=$(this).attr("data-bs-toggle");if(void 0!==r&&"tooltip"===r){var n=t.format("llll");$(this).attr("data-bs-title",n),new bootstrap.Tooltip($(this))}})),function(){if($(j).length){var t=new ClipboardJS(j,{target:function(t){return t.parentNode.nextElementSibling.querySelector("code .rouge-code")}});o(document.querySelectorAll(j)).map((function(t){return new bootstrap.Tooltip(t,{placement:"left"})})),t.on("success",(function(t){t.clearSelection();var e=t.trigger;N(e)||(!function(t){$(t).children().attr("class",K)}(e),function(t){var e=$(t).attr(V);$(t).attr(Y,e).tooltip("show")}(e),L(e),setTimeout((function(){!function(t){$(t).tooltip("hide").removeAttr(Y)}(e),function(t){$(t).children().attr("class",R)}(e),M(e)}),F))}))}$("#copy-link").on("click",(function(t){var e=$(t.target);N(e)||navigator.clipboard.writeText(window.location.href).then((function(){var t=e.attr(Y),r=e.attr(V);e.attr(Y,r).tooltip("show"),L(e),setTimeout((function(){e.attr(Y,t),M(e)}),F)}))}))}(),document.querySelector("#core-wrapper h2,#core-wrapper h3")&&tocbot.init({tocSelector:"#toc",contentSelector:".post-content",ignoreSelector:"[data-toc-skip]",headingSelector:"h2, h3",orderedList:!1,scrollSmooth:!1}),$(".pageviews").length<=0||(U.inspectKeys(),U.hasCache()?(B(U.getCache()),U.isExpired()?z.hasLocalMeta()?Q(!0).then(G):G():U.isFromLocal()&&G()):z.hasLocalMeta()?Q().then(G):G())}();
+!function(){"use strict";function t(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}function e(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,i(n.key),n)}}function r(t,r,n){return r&&e(t.prototype,r),n&&e(t,n),Object.defineProperty(t,"prototype",{writable:!1}),t}function n(t,e,r){return(e=i(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function o(t){return function(t){if(Array.isArray(t))return a(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);"Object"===r&&t.constructor&&(r=t.constructor.name);if("Map"===r||"Set"===r)return Array.from(t);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return a(t,e)}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function i(t){var e=function(t,e){if("object"!=typeof t||null===t)return t;var r=t[Symbol.toPrimitive];if(void 0!==r){var n=r.call(t,e||"default");if("object"!=typeof n)return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===e?String:Number)(t)}(t,"string");return"symbol"==typeof e?e:String(e)}var c=$(".mode-toggle");var l=$("body"),s="sidebar-display",u=function(){function e(){t(this,e)}return r(e,null,[{key:"toggle",value:function(){!1===e.isExpanded?l.attr(s,""):l.removeAttr(s),e.isExpanded=!e.isExpanded}}]),e}();n(u,"isExpanded",!1);var f=$("#sidebar-trigger"),p=$("#search-trigger"),d=$("#search-cancel"),m=$("#main>.row"),g=$("#topbar-title"),v=$("#search-wrapper"),h=$("#search-result-wrapper"),y=$("#search-results"),b=$("#search-input"),w=$("#search-hints"),C=$("html,body"),S=$("#lang-sec-center"),k="loaded",E="unloaded",T="input-focus",x="d-flex",P=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){e.offset=window.scrollY,C.scrollTop(0)}},{key:"off",value:function(){C.scrollTop(e.offset)}}]),e}();n(P,"offset",0),n(P,"resultVisible",!1);var _=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){f.addClass(E),g.addClass(E),p.addClass(E),v.addClass(x),d.addClass(k),S.addClass(E)}},{key:"off",value:function(){d.removeClass(k),v.removeClass(x),f.removeClass(E),g.removeClass(E),p.removeClass(E),S.removeClass(E)}}]),e}(),A=function(){function e(){t(this,e)}return r(e,null,[{key:"on",value:function(){P.resultVisible||(P.on(),h.removeClass(E),m.addClass(E),P.resultVisible=!0)}},{key:"off",value:function(){P.resultVisible&&(y.empty(),w.hasClass(E)&&w.removeClass(E),h.addClass(E),m.removeClass(E),P.off(),b.val(""),P.resultVisible=!1)}}]),e}();function I(){return d.hasClass(k)}$(".collapse");var j=".code-header>button",K="fas fa-check",O="timeout",V="data-title-succeed",Y="data-bs-original-title",F=2e3;function N(t){if($(t)[0].hasAttribute(O)){var e=$(t).attr(O);if(Number(e)>Date.now())return!0}return!1}function L(t){$(t).attr(O,Date.now()+F)}function M(t){$(t).removeAttr(O)}var R=$(j).children().attr("class");var D=function(){function e(){t(this,e)}return r(e,null,[{key:"attrTimestamp",get:function(){return"data-ts"}},{key:"attrDateFormat",get:function(){return"data-df"}},{key:"locale",get:function(){return $("html").attr("lang").substring(0,2)}},{key:"getTimestamp",value:function(t){return Number(t.attr(e.attrTimestamp))}},{key:"getDateFormat",value:function(t){return t.attr(e.attrDateFormat)}}]),e}();var J,q=(J=!1,function(){var t=J;return J||(J=!0),t}),z=function(){function t(t){return $(t).attr("content")}function e(e){var r=t(e);return void 0!==r&&!1!==r}return{getProxyMeta:function(){return t("meta[name=pv-proxy-endpoint]")},getLocalMeta:function(){return t("meta[name=pv-cache-path]")},hasProxyMeta:function(){return e("meta[name=pv-proxy-endpoint]")},hasLocalMeta:function(){return e("meta[name=pv-cache-path]")}}}(),U=function(){var t={KEY_PV:"pv",KEY_PV_SRC:"pv_src",KEY_CREATION:"pv_created_date"},e="same-origin",r="cors";function n(t){return localStorage.getItem(t)}function o(t,e){localStorage.setItem(t,e)}function a(e,r){o(t.KEY_PV,e),o(t.KEY_PV_SRC,r),o(t.KEY_CREATION,(new Date).toJSON())}return{keysCount:function(){return Object.keys(t).length},hasCache:function(){return null!==localStorage.getItem(t.KEY_PV)},getCache:function(){return JSON.parse(localStorage.getItem(t.KEY_PV))},saveLocalCache:function(t){a(t,e)},saveProxyCache:function(t){a(t,r)},isExpired:function(){var e=new Date(n(t.KEY_CREATION));return e.setHours(e.getHours()+1),Date.now()>=e.getTime()},isFromLocal:function(){return n(t.KEY_PV_SRC)===e},isFromProxy:function(){return n(t.KEY_PV_SRC)===r},newerThan:function(t){return U.getCache().totalsForAllResults["ga:pageviews"]>t.totalsForAllResults["ga:pageviews"]},inspectKeys:function(){if(localStorage.length===U.keysCount())for(var e=0;e<localStorage.length;e++){switch(localStorage.key(e)){case t.KEY_PV:case t.KEY_PV_SRC:case t.KEY_CREATION:break;default:return void localStorage.clear()}}else localStorage.clear()}}}();function H(t,e,r,n){var o=function(t,e){var r=0;if(void 0!==e)for(var n=0;n<e.length;++n)if(e[parseInt(n,10)][0]===t){r+=parseInt(e[parseInt(n,10)][1],10);break}return r}(e,t);if(o=0===o?1:o,n){var a=parseInt(r.text().replace(/,/g,""),10);o>a&&function(t,e,r){if(t<e){var n=new CountUp(r,t,e);n.error?console.error(n.error):n.start()}}(a,o,r.attr("id"))}else r.text((new Intl.NumberFormat).format(o))}function B(t){if(void 0!==t){var e=q(),r=t.rows;if($(".post").length>0)H(r,window.location.pathname,$("#pv"),e)}}function G(){z.hasProxyMeta()&&$.ajax({type:"GET",url:z.getProxyMeta(),dataType:"jsonp",success:function(t){B(t),U.saveProxyCache(JSON.stringify(t))},error:function(t,e,r){console.log("Failed to load pageviews from proxy server: "+r)}})}function Q(){var t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return fetch(z.getLocalMeta()).then((function(t){return t.json()})).then((function(e){t&&U.isFromProxy()&&U.newerThan(e)||(B(e),U.saveLocalCache(JSON.stringify(e)))}))}$(window).on("scroll",(function(){$(window).scrollTop()>50?$("#back-to-top").fadeIn():$("#back-to-top").fadeOut()})),$("#back-to-top").on("click",(function(){window.scrollTo(0,0)})),o(document.querySelectorAll('[data-bs-toggle="tooltip"]')).map((function(t){return new bootstrap.Tooltip(t)})),0!==c.length&&c.off().on("click",(function(t){var e=$(t.target),r=e.prop("tagName")==="button".toUpperCase()?e:e.parent();modeToggle.flipMode(),r.trigger("blur")})),$("#sidebar-trigger").on("click",u.toggle),$("#mask").on("click",u.toggle),p.on("click",(function(){console.log("dsgdfgd"),_.on(),A.on(),b.trigger("focus")})),d.on("click",(function(){_.off(),A.off()})),b.on("focus",(function(){v.addClass(T)})),b.on("focusout",(function(){v.removeClass(T)})),b.on("input",(function(){""===b.val()?I()?w.removeClass(E):A.off():(A.on(),I()&&w.addClass(E))})),$("#core-wrapper img[data-src]")<=0||document.addEventListener("lazyloaded",(function(t){$(t.target).parent().removeClass("shimmer")})),$(".popup")<=0||$(".popup").magnificPopup({type:"image",closeOnContentClick:!0,showCloseBtn:!1,zoom:{enabled:!0,duration:300,easing:"ease-in-out"}}),dayjs.locale(D.locale),dayjs.extend(window.dayjs_plugin_localizedFormat),$("[".concat(D.attrTimestamp,"]")).each((function(){var t=dayjs.unix(D.getTimestamp($(this))),e=t.format(D.getDateFormat($(this)));$(this).text(e),$(this).removeAttr(D.attrTimestamp),$(this).removeAttr(D.attrDateFormat);var r=$(this).attr("data-bs-toggle");if(void 0!==r&&"tooltip"===r){var n=t.format("llll");$(this).attr("data-bs-title",n),new bootstrap.Tooltip($(this))}})),function(){if($(j).length){var t=new ClipboardJS(j,{target:function(t){return t.parentNode.nextElementSibling.querySelector("code .rouge-code")}});o(document.querySelectorAll(j)).map((function(t){return new bootstrap.Tooltip(t,{placement:"left"})})),t.on("success",(function(t){t.clearSelection();var e=t.trigger;N(e)||(!function(t){$(t).children().attr("class",K)}(e),function(t){var e=$(t).attr(V);$(t).attr(Y,e).tooltip("show")}(e),L(e),setTimeout((function(){!function(t){$(t).tooltip("hide").removeAttr(Y)}(e),function(t){$(t).children().attr("class",R)}(e),M(e)}),F))}))}$("#copy-link").on("click",(function(t){var e=$(t.target);N(e)||navigator.clipboard.writeText(window.location.href).then((function(){var t=e.attr(Y),r=e.attr(V);e.attr(Y,r).tooltip("show"),L(e),setTimeout((function(){e.attr(Y,t),M(e)}),F)}))}))}(),function(){var t=document.querySelectorAll("#toc .toc-link");t.length>0?function(t){var e=[];t.forEach((function(t){var r=document.getElementById(decodeURIComponent(t.hash.substring(1)));null!==r&&e.push({link:t,heading:r})}));var r=null,i=null,n=!1;function a(t){if(null===t)return null;var e=t.closest("#toc > .toc-list > .toc-list-item");return null===e?null:e.querySelector(".is-collapsible")}function o(){n=!1;for(var t=null,o=0;o<e.length&&!(e[o].heading.getBoundingClientRect().top>80);o++)t=e[o].link;if(t!==r){null!==r&&r.classList.remove("is-active-link"),null!==t&&t.classList.add("is-active-link"),r=t;var c=a(t);c!==i&&(null!==i&&i.classList.add("is-collapsed"),null!==c&&c.classList.remove("is-collapsed"),i=c)}}window.addEventListener("scroll",(function(){n||(n=!0,window.requestAnimationFrame(o))}),{passive:!0}),o()}(Array.from(t)):"undefined"!=typeof tocbot&&document.querySelector("#core-wrapper h2,#core-wrapper h3")&&tocbot.init({tocSelector:"#toc",contentSelector:".post-content",ignoreSelector:"[data-toc-skip]",headingSelector:"h2, h3",orderedList:!1,scrollSmooth:!1})}(),$(".pageviews").length<=0||(U.inspectKeys(),U.hasCache()?(B(U.getCache()),U.isExpired()?z.hasLocalMeta()?Q(!0).then(G):G():U.isFromLocal()&&G()):z.hasLocalMeta()?Q().then(G):G())}();
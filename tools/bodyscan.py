@@ -0,0 +1,190 @@
+import re
+import sys
+import itertools
+
+# single streaming pass over the markdown body of a post (everything after the front matter)
+# ATX headings are collected here with ids generated the same way kramdown GFM parser does,
+# so the TOC can be rendered at build time instead of scanning the DOM in the browser,
+# image references are collected in the same pass for the responsive image stage
+
+# bump it on any change of scanning rules, gen.py rescans every post scanned by other version
+SCAN_VERSION = 2
+
+ATX_HEADING_RE = re.compile(r"^(#{1,6})[\t ]+(.*?)\s*$")
+HEADING_ID_RE = re.compile(r"[\t ]\{#([A-Za-z][\w:-]*)\}$")
+# kramdown strips closing sequence only if it's separated by whitespace: /[\t ]#+\z/
+HEADING_CLOSE_RE = re.compile(r"[\t ]+#+$")
+# block IAL always starts with "{:", so liquid tags like {% raw %} are not taken for it
+BLOCK_IAL_RE = re.compile(r"^\{:(.*)\}\s*$")
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+MATH_BLOCK = "$$"
+
+# kramdown GFM: NON_WORD_RE = /[^\p{Word}\- \t]/
+NON_WORD_RE = re.compile(r"[^\w\- \t]")
+LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+INLINE_MARKS = ("**", "__", "`")
+
+MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+HTML_IMAGE_RE = re.compile(r"<img\s[^>]*?src=[\"']([^\"']+)[\"']")
+
+FRONT_MATTER = "---"
+
+def panic(msg):
+    print(msg)
+    sys.exit(-1)
+
+class Heading:
+    def __init__(self, level, raw_text, id):
+        self.level = level
+        self.raw_text = raw_text
+        self.text = heading_text(raw_text)
+        self.id = id
+        self.skip = False
+
+    def to_dict(self):
+        return {"level": self.level, "text": self.text, "id": self.id, "skip": self.skip}
+
+class BodyScan:
+    def __init__(self):
+        self.headings = []
+        self.images = []
+
+    def add_image(self, src):
+        if src not in self.images:
+            self.images.append(src)
+
+def heading_text(raw_text):
+    text = LINK_RE.sub(r"\1", raw_text)
+    for mark in INLINE_MARKS:
+        text = text.replace(mark, "")
+    return text
+
+# see generate_gfm_header_id in kramdown-parser-gfm
+def gfm_header_id(raw_text, id_counter):
+    result = NON_WORD_RE.sub("", raw_text.lower())
+    result = result.replace(" ", "-").replace("\t", "-")
+
+    count = id_counter.get(result, -1) + 1
+    id_counter[result] = count
+    if count > 0:
+        result += "-{0}".format(count)
+    return result
+
+def collect_images(line, body_scan):
+    if "!" in line:
+        for match in MD_IMAGE_RE.finditer(line):
+            body_scan.add_image(match.group(1))
+    if "<img" in line:
+        for match in HTML_IMAGE_RE.finditer(line):
+            body_scan.add_image(match.group(1))
+
+def parse_atx_heading(line):
+    match = ATX_HEADING_RE.match(line)
+    if match is None:
+        return None
+
+    text = match.group(2)
+    id = None
+    id_match = HEADING_ID_RE.search(text)
+    if id_match:
+        id = id_match.group(1)
+        text = text[:id_match.start()].rstrip()
+
+    text = HEADING_CLOSE_RE.sub("", text).rstrip()
+    if len(text) == 0:
+        return None
+
+    return Heading(len(match.group(1)), text, id)
+
+def apply_block_ial(heading, line):
+    match = BLOCK_IAL_RE.match(line)
+    if match is None:
+        return False
+
+    for attr in match.group(1).split():
+        if attr.startswith("#"):
+            heading.id = attr[1:]
+        elif attr.split("=")[0] == "data-toc-skip":
+            heading.skip = True
+    return True
+
+class FenceState:
+    def __init__(self):
+        self.fence = None
+        self.in_math = False
+
+    # return True if line is part of code or math block (including the delimiters)
+    def consume(self, line):
+        if self.fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(self.fence) and stripped.strip(self.fence[0]) == "":
+                self.fence = None
+            return True
+
+        if self.in_math:
+            if MATH_BLOCK in line:
+                self.in_math = False
+            return True
+
+        match = FENCE_RE.match(line)
+        if match:
+            self.fence = match.group(1)
+            return True
+
+        if line.startswith(MATH_BLOCK):
+            if MATH_BLOCK not in line.rstrip()[len(MATH_BLOCK):]:
+                self.in_math = True
+            return True
+
+        return False
+
+def skip_front_matter(file_handle):
+    first = file_handle.readline()
+    if first.rstrip() != FRONT_MATTER:
+        return first
+
+    for line in file_handle:
+        if line.rstrip() == FRONT_MATTER:
+            return None
+    return None
+
+def scan_post_body(path):
+    result = BodyScan()
+
+    try:
+        file_handle = open(path, "r", encoding="utf-8")
+    except OSError as e:
+        panic(str(e))
+
+    fence_state = FenceState()
+    pending = None
+    id_counter = dict()
+
+    def finish_heading(heading):
+        # explicit ids don't take part in auto id counting, same as in kramdown
+        if heading.id is None:
+            heading.id = gfm_header_id(heading.raw_text, id_counter)
+        result.headings.append(heading)
+
+    first_line = skip_front_matter(file_handle)
+    lines = file_handle if first_line is None else itertools.chain([first_line], file_handle)
+
+    for line in lines:
+        if pending is not None:
+            ial_applied = apply_block_ial(pending, line)
+            finish_heading(pending)
+            pending = None
+            if ial_applied:
+                continue
+
+        if fence_state.consume(line):
+            continue
+
+        collect_images(line, result)
+        pending = parse_atx_heading(line)
+
+    if pending is not None:
+        finish_heading(pending)
+
+    file_handle.close()
+    return result
@@ -2,9 +2,16 @@ import os
 import sys
 import datetime
 import math
+import json
+
+import postdb
+import bodyscan
+import images
 
 # this script was made to serve my needs, parser for front matter isn't bullet proof
 # so it can not work for you style of front matter
+# responsive images need Pillow (pip install Pillow), AVIF variants need Pillow built with AVIF
+# or pillow-avif-plugin for older versions, without Pillow that stage is skipped
 
 PAGES_PER_PAGE = 10
 SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
@@ -12,6 +19,8 @@ POST_PATH = os.path.abspath(SCRIPT_PATH+"/../_posts")
 CATEG_PATH = os.path.abspath(SCRIPT_PATH+"/../_categs_clet")
 TAG_PATH = os.path.abspath(SCRIPT_PATH+"/../_tags_clet")
 PAGES_PATH = os.path.abspath(SCRIPT_PATH+"/../_pages_clet")
+TOC_DATA_PATH = os.path.abspath(SCRIPT_PATH+"/../_data/toc")
+TOC_LEVELS = (2, 3)
 
 class TokenType:
     UNKNOWN = 0
@@ -117,6 +126,8 @@ class PostsData:
         self.agg_tags = dict()
         self.agg_categ = dict()
         self.posts = dict()
+        self.file_info = dict()
+        self.body_scans = dict()
     
     def agg_post(self, name, post_data, path):
         if name in self.posts:
@@ -479,7 +490,7 @@ def parse_post_params(data, size, err_path):
     return result_post_params
 
 
-def collect_lang_folder_data(folder_scan_item):
+def collect_lang_folder_data(folder_scan_item, post_db):
     lang_dir = os.scandir(folder_scan_item.path)
     posts_data = PostsData()
     
@@ -503,6 +514,9 @@ def collect_lang_folder_data(folder_scan_item):
                 post_params = parse_post_params(data, read_size, item.path)
                 posts_data.agg_post(item.name, post_params, folder_scan_item.path)
                 file_handle.close()
+
+                file_info = postdb.get_file_info(post_db, folder_scan_item.name, item.name, file_stat, item.path)
+                posts_data.file_info[item.name] = file_info
         else:
             panic("Error: {0} is not a file".format(item.path))
 
@@ -510,7 +524,7 @@ def collect_lang_folder_data(folder_scan_item):
     return posts_data
 
 
-def collect_posts_info(posts_folders):
+def collect_posts_info(posts_folders, post_db):
     post_dir = os.scandir(POST_PATH)
 
     for item in post_dir:
@@ -518,7 +532,7 @@ def collect_posts_info(posts_folders):
             if item.name in posts_folders:
                 panic("Error: folder \"{0}\" already exist".format(item.name))
             else:
-                posts_data = collect_lang_folder_data(item)
+                posts_data = collect_lang_folder_data(item, post_db)
                 posts_folders[item.name] = posts_data
         
         if item.is_file():
@@ -695,20 +709,99 @@ def gen_collect(posts_folders):
         create_collect(lang_posts.agg_categ, categ_path, CATEG_HEADER_TEMPLATE)
         create_pages(lang_posts.posts, pages_path, lang_name)
 
+# nest h3 under preceding h2, same structure tocbot builds for headingSelector 'h2, h3'
+def build_toc_tree(headings):
+    result = []
+    for heading in headings:
+        if heading.skip or heading.level not in TOC_LEVELS:
+            continue
+
+        item = {"id": heading.id, "text": heading.text, "level": heading.level, "children": []}
+        if heading.level == TOC_LEVELS[0] or len(result) == 0:
+            result.append(item)
+        else:
+            result[-1]["children"].append(item)
+    return result
+
+def write_toc_data(path, headings):
+    toc_data = {
+        "headings": [heading.to_dict() for heading in headings],
+        "toc": build_toc_tree(headings)
+    }
+
+    try:
+        file_handle = open(path, "w", encoding="utf-8")
+    except OSError as e:
+        panic(str(e))
+    json.dump(toc_data, file_handle, ensure_ascii=False, indent=2)
+    file_handle.write("\n")
+    file_handle.close()
+
+def toc_data_path(lang_name, post_name):
+    return os.path.join(TOC_DATA_PATH, lang_name, os.path.splitext(post_name)[0] + ".json")
+
+def remove_stale_toc_data(posts_folders):
+    if not os.path.exists(TOC_DATA_PATH):
+        return
+
+    toc_dir = os.scandir(TOC_DATA_PATH)
+    for lang_item in toc_dir:
+        if lang_item.is_dir():
+            lang_dir = os.scandir(lang_item.path)
+            for item in lang_dir:
+                post_name = os.path.splitext(item.name)[0] + ".md"
+                if lang_item.name not in posts_folders or post_name not in posts_folders[lang_item.name].posts:
+                    os.remove(item.path)
+            lang_dir.close()
+    toc_dir.close()
+
+# only posts with changed content, scanned by other version of bodyscan
+# or with missing toc data file are scanned again
+def scan_posts_body(posts_folders):
+    for lang_name in posts_folders:
+        lang_posts = posts_folders[lang_name]
+        for post_name in lang_posts.posts:
+            file_info = lang_posts.file_info[post_name]
+            if (file_info.changed or file_info.scan_version != bodyscan.SCAN_VERSION
+                    or not os.path.exists(toc_data_path(lang_name, post_name))):
+                post_path = os.path.join(POST_PATH, lang_name, post_name)
+                lang_posts.body_scans[post_name] = bodyscan.scan_post_body(post_path)
+
+def gen_toc(posts_folders):
+    remove_stale_toc_data(posts_folders)
+
+    for lang_name in posts_folders:
+        lang_posts = posts_folders[lang_name]
+        try:
+            os.makedirs(os.path.join(TOC_DATA_PATH, lang_name), exist_ok=True)
+        except OSError as e:
+            panic(e)
+
+        for post_name in lang_posts.body_scans:
+            write_toc_data(toc_data_path(lang_name, post_name), lang_posts.body_scans[post_name].headings)
+
 def main():
     check_start_up_paths()
 
+    post_db = postdb.open_post_db()
+
     posts_folders = dict()
-    collect_posts_info(posts_folders)
+    collect_posts_info(posts_folders, post_db)
 
     err_list = []
     check_posts_lang_copy(posts_folders, err_list)
 
     if len(err_list) == 0:
         gen_collect(posts_folders)
+        scan_posts_body(posts_folders)
+        gen_toc(posts_folders)
+        postdb.sync_posts(post_db, posts_folders, bodyscan.SCAN_VERSION, Field)
+        images.gen_images(post_db)
     else:
         for err in err_list:
             print(err)
 
+    post_db.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,250 @@
+import os
+import sys
+import json
+import base64
+import io
+import concurrent.futures
+
+import postdb
+
+# responsive variants for images referenced by posts
+# every referenced image from assets/img/post gets resized WebP (and AVIF if Pillow can write it) variants
+# plus tiny LQIP placeholder, intrinsic size and variants are recorded in _data/images.json for templates
+# variant file names contain the source hash and the manifest keeps that hash,
+# so unchanged images are never encoded again, only formats missing for them are added
+# Pillow is optional, without it nothing is encoded, only entries of changed or removed images are dropped
+
+SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
+SITE_PATH = os.path.abspath(SCRIPT_PATH+"/..")
+IMG_MANIFEST_PATH = os.path.join(SITE_PATH, "_data", "images.json")
+IMG_SRC_PREFIX = "/assets/img/post/"
+IMG_RESP_PREFIX = "/assets/img/resp/"
+
+VARIANT_WIDTHS = (480, 960, 1440)
+LQIP_WIDTH = 16
+HASH_PREFIX_LEN = 12
+
+# format name in manifest: (Pillow format, save options, save options for lossless sources)
+# post images are mostly palette diagrams, lossy WebP of them is bigger than the PNG itself,
+# but once resampled lossless is way bigger, so lossless options are used only for the native width
+FORMATS = {
+    "avif": ("AVIF", {"quality": 60}, {"quality": 60}),
+    "webp": ("WEBP", {"quality": 80, "method": 6}, {"lossless": True, "method": 6}),
+}
+LOSSLESS_SRC_EXT = (".png", ".gif")
+
+def panic(msg):
+    print(msg)
+    sys.exit(-1)
+
+def load_pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    # older Pillow can write AVIF only through the plugin
+    try:
+        import pillow_avif
+    except ImportError:
+        pass
+
+    Image.init()
+    return Image
+
+def url_to_path(url):
+    return os.path.join(SITE_PATH, url.lstrip("/"))
+
+def variant_base_url(src, src_hash):
+    rel_path = os.path.splitext(src[len(IMG_SRC_PREFIX):])[0]
+    return "{0}{1}-{2}".format(IMG_RESP_PREFIX, rel_path, src_hash[:HASH_PREFIX_LEN])
+
+def variant_widths(width):
+    result = [w for w in VARIANT_WIDTHS if w < width]
+    result.append(width)
+    return result
+
+def normalize_mode(img):
+    if img.mode in ("RGB", "RGBA"):
+        return img
+    if img.mode in ("LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        return img.convert("RGBA")
+    return img.convert("RGB")
+
+# downscaled lossy variant of a lossless source can be bigger than the wider (even native lossless) one,
+# browser with high DPI picks exactly it, so keep only variants smaller than the next wider kept one
+# and than the source, native width is always kept as the top of srcset
+def drop_heavy_variants(variants, src_size):
+    result = [variants[-1]]
+    limit = min(src_size, os.path.getsize(url_to_path(variants[-1]["src"])))
+    for variant in reversed(variants[:-1]):
+        path = url_to_path(variant["src"])
+        size = os.path.getsize(path)
+        if size < limit:
+            result.insert(0, variant)
+            limit = size
+        else:
+            os.remove(path)
+    return result
+
+# runs in worker process
+def encode_image(job):
+    src, src_hash, formats = job
+    Image = load_pillow()
+
+    img = Image.open(url_to_path(src))
+    img.load()
+    width, height = img.size
+    img = normalize_mode(img)
+
+    base_url = variant_base_url(src, src_hash)
+    os.makedirs(os.path.dirname(url_to_path(base_url)), exist_ok=True)
+
+    is_lossless = os.path.splitext(src)[1].lower() in LOSSLESS_SRC_EXT
+    variants = {fmt: [] for fmt in formats}
+    for w in variant_widths(width):
+        if w == width:
+            resized = img
+        else:
+            resized = img.resize((w, max(1, round(height*w/width))), Image.LANCZOS)
+
+        for fmt in formats:
+            pil_format, lossy_options, lossless_options = FORMATS[fmt]
+            options = lossless_options if is_lossless and w == width else lossy_options
+            url = "{0}-{1}.{2}".format(base_url, w, fmt)
+            resized.save(url_to_path(url), pil_format, **options)
+            variants[fmt].append({"src": url, "width": w})
+
+    src_size = os.path.getsize(url_to_path(src))
+    for fmt in formats:
+        variants[fmt] = drop_heavy_variants(variants[fmt], src_size)
+
+    lqip_height = max(1, round(height*LQIP_WIDTH/width))
+    lqip_buffer = io.BytesIO()
+    img.resize((LQIP_WIDTH, lqip_height), Image.BILINEAR).save(lqip_buffer, "WEBP", quality=30)
+    lqip = "data:image/webp;base64," + base64.b64encode(lqip_buffer.getvalue()).decode("ascii")
+    img.close()
+
+    return src, {
+        "hash": src_hash,
+        "width": width,
+        "height": height,
+        "lqip": lqip,
+        "variants": variants,
+    }
+
+def load_manifest():
+    if not os.path.exists(IMG_MANIFEST_PATH):
+        return dict()
+
+    try:
+        file_handle = open(IMG_MANIFEST_PATH, "r", encoding="utf-8")
+    except OSError as e:
+        panic(str(e))
+    try:
+        result = json.load(file_handle)
+    except ValueError:
+        print("{0} is broken, all images will be encoded again".format(IMG_MANIFEST_PATH))
+        result = dict()
+    file_handle.close()
+    return result
+
+def write_manifest(manifest):
+    try:
+        file_handle = open(IMG_MANIFEST_PATH, "w", encoding="utf-8")
+    except OSError as e:
+        panic(str(e))
+    json.dump(manifest, file_handle, indent=2, sort_keys=True)
+    file_handle.write("\n")
+    file_handle.close()
+
+def entry_files(entry):
+    result = []
+    for fmt in entry["variants"]:
+        for variant in entry["variants"][fmt]:
+            result.append(url_to_path(variant["src"]))
+    return result
+
+# formats of the entry whose files are all in place, other formats have to be encoded again
+def valid_entry_formats(entry):
+    result = []
+    for fmt in entry.get("variants", dict()):
+        variants = entry["variants"][fmt]
+        if all(os.path.exists(url_to_path(variant["src"])) for variant in variants):
+            result.append(fmt)
+    return result
+
+def encode_jobs(jobs):
+    result = dict()
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = {executor.submit(encode_image, job): job[0] for job in jobs}
+        for future in concurrent.futures.as_completed(futures):
+            src = futures[future]
+            try:
+                result[src] = future.result()[1]
+            except Exception as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                panic("can't encode image {0}: {1}".format(src, e))
+    return result
+
+# image list comes from the post db, so unchanged posts are not scanned again
+# entries of changed images are dropped even without Pillow, so templates never get stale size or variants
+def gen_images(post_db):
+    srcs = [src for src, _ in postdb.query_images(post_db) if src.startswith(IMG_SRC_PREFIX)]
+
+    old_manifest = load_manifest()
+    manifest = dict()
+    src_hashes = dict()
+
+    postdb.prune_images(post_db, srcs)
+    for src in srcs:
+        path = url_to_path(src)
+        if not os.path.isfile(path):
+            panic("image {0} referenced in posts does not exist".format(src))
+
+        src_hash = postdb.get_image_hash(post_db, src, path)
+        src_hashes[src] = src_hash
+        entry = old_manifest.get(src)
+        if entry is not None and entry.get("hash") == src_hash:
+            # keep formats this machine can't write (e.g. AVIF made elsewhere), encode only missing ones
+            valid_formats = valid_entry_formats(entry)
+            entry = dict(entry)
+            entry["variants"] = {fmt: entry["variants"][fmt] for fmt in valid_formats}
+            manifest[src] = entry
+
+    post_db.commit()
+
+    jobs = []
+    Image = load_pillow()
+    if Image is None:
+        print("Pillow is not installed, responsive images are not generated")
+    else:
+        formats = [fmt for fmt in FORMATS if FORMATS[fmt][0] in Image.SAVE]
+        for src in srcs:
+            if src in manifest:
+                missing_formats = [fmt for fmt in formats if fmt not in manifest[src]["variants"]]
+            else:
+                missing_formats = formats
+
+            if len(missing_formats) > 0:
+                jobs.append((src, src_hashes[src], missing_formats))
+
+    if len(jobs) > 0:
+        encoded = encode_jobs(jobs)
+        for src in encoded:
+            if src in manifest:
+                manifest[src]["variants"].update(encoded[src]["variants"])
+            else:
+                manifest[src] = encoded[src]
+
+    # drop every variant file that isn't in the manifest anymore
+    kept_files = set()
+    for src in manifest:
+        kept_files.update(entry_files(manifest[src]))
+    for src in old_manifest:
+        for path in entry_files(old_manifest[src]):
+            if path not in kept_files and os.path.exists(path):
+                os.remove(path)
+
+    if manifest != old_manifest:
+        write_manifest(manifest)
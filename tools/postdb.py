@@ -0,0 +1,301 @@
+import os
+import sys
+import sqlite3
+import hashlib
+import datetime
+import argparse
+
+# local sqlite store of parsed post metadata, gen.py keep it in sync on every run
+# so other build stages and editorial tooling don't need to rescan _posts
+# the db is only a cache, if schema version doesn't match gen.py just rebuilds it from scratch
+
+SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
+POST_DB_PATH = os.path.abspath(SCRIPT_PATH+"/../.cache/posts.sqlite3")
+
+SCHEMA_VERSION = 4
+HASH_READ_SIZE = 64*1024
+
+SCHEMA = """
+CREATE TABLE posts (
+    id INTEGER PRIMARY KEY,
+    lang TEXT NOT NULL,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    date_ts INTEGER NOT NULL,
+    pin INTEGER NOT NULL DEFAULT 0,
+    math INTEGER NOT NULL DEFAULT 0,
+    languniq INTEGER NOT NULL DEFAULT 0,
+    hash TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    scan_version INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (lang, name)
+);
+CREATE INDEX posts_date_idx ON posts (date_ts);
+CREATE INDEX posts_lang_date_idx ON posts (lang, date_ts);
+CREATE INDEX posts_pin_idx ON posts (date_ts) WHERE pin = 1;
+CREATE INDEX posts_languniq_idx ON posts (date_ts) WHERE languniq = 1;
+
+CREATE TABLE post_tags (
+    tag TEXT NOT NULL,
+    post_id INTEGER NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, post_id)
+) WITHOUT ROWID;
+CREATE INDEX post_tags_post_idx ON post_tags (post_id);
+
+CREATE TABLE post_categs (
+    categ TEXT NOT NULL,
+    post_id INTEGER NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    PRIMARY KEY (categ, post_id)
+) WITHOUT ROWID;
+CREATE INDEX post_categs_post_idx ON post_categs (post_id);
+
+CREATE TABLE post_images (
+    src TEXT NOT NULL,
+    post_id INTEGER NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    PRIMARY KEY (src, post_id)
+) WITHOUT ROWID;
+CREATE INDEX post_images_post_idx ON post_images (post_id);
+
+CREATE TABLE images (
+    src TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+class FileInfo:
+    def __init__(self, hash, mtime_ns, size, changed, scan_version=0):
+        self.hash = hash
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.changed = changed
+        self.scan_version = scan_version
+
+def panic(msg):
+    print(msg)
+    sys.exit(-1)
+
+def drop_tables(db):
+    tables = db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    for table in tables:
+        db.execute("DROP TABLE IF EXISTS \"{0}\"".format(table[0]))
+
+def open_post_db(path=POST_DB_PATH, create=True):
+    if not create and not os.path.exists(path):
+        panic("post db {0} does not exist, run gen.py first".format(path))
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        db = sqlite3.connect(path)
+    except (OSError, sqlite3.Error) as e:
+        panic(str(e))
+
+    db.execute("PRAGMA foreign_keys = ON")
+
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if version != SCHEMA_VERSION:
+        # only gen.py is allowed to rebuild the db, otherwise query would silently return nothing
+        if not create:
+            db.close()
+            panic("post db schema is outdated, run gen.py")
+        with db:
+            drop_tables(db)
+        db.executescript(SCHEMA)
+        db.execute("PRAGMA user_version = {0}".format(SCHEMA_VERSION))
+        db.commit()
+
+    return db
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+    try:
+        file_handle = open(path, "rb")
+    except OSError as e:
+        panic(str(e))
+
+    chunk = file_handle.read(HASH_READ_SIZE)
+    while chunk:
+        hasher.update(chunk)
+        chunk = file_handle.read(HASH_READ_SIZE)
+    file_handle.close()
+
+    return hasher.hexdigest()
+
+# compare file stat with the one recorded in db and rehash only if it differs
+def get_file_info(db, lang, name, file_stat, path):
+    row = db.execute("SELECT hash, mtime_ns, size, scan_version FROM posts WHERE lang = ? AND name = ?", (lang, name)).fetchone()
+    if row is not None and row[1] == file_stat.st_mtime_ns and row[2] == file_stat.st_size:
+        return FileInfo(row[0], row[1], row[2], False, row[3])
+
+    file_hash = hash_file(path)
+    changed = row is None or row[0] != file_hash
+    scan_version = 0 if row is None else row[3]
+    return FileInfo(file_hash, file_stat.st_mtime_ns, file_stat.st_size, changed, scan_version)
+
+# same stat shortcut as get_file_info, but for images referenced by posts
+def get_image_hash(db, src, path):
+    try:
+        file_stat = os.stat(path)
+    except OSError as e:
+        panic(str(e))
+
+    row = db.execute("SELECT hash, mtime_ns, size FROM images WHERE src = ?", (src,)).fetchone()
+    if row is not None and row[1] == file_stat.st_mtime_ns and row[2] == file_stat.st_size:
+        return row[0]
+
+    file_hash = hash_file(path)
+    db.execute("INSERT OR REPLACE INTO images (src, hash, mtime_ns, size) VALUES (?, ?, ?, ?)",
+        (src, file_hash, file_stat.st_mtime_ns, file_stat.st_size))
+    return file_hash
+
+def prune_images(db, srcs):
+    srcs = set(srcs)
+    for row in db.execute("SELECT src FROM images").fetchall():
+        if row[0] not in srcs:
+            db.execute("DELETE FROM images WHERE src = ?", (row[0],))
+
+def write_post(db, lang, name, post_data, file_info, body_scan, scan_version, fields):
+    date = post_data[fields.DATE]
+    params = (
+        lang, name, date.isoformat(), int(date.timestamp()),
+        int(post_data.get(fields.PIN, False)),
+        int(post_data.get(fields.MATH, False)),
+        int(post_data.get(fields.LANG_UNIQ, False)),
+        file_info.hash, file_info.mtime_ns, file_info.size, scan_version)
+
+    db.execute("DELETE FROM posts WHERE lang = ? AND name = ?", (lang, name))
+    cursor = db.execute("INSERT INTO posts (lang, name, date, date_ts, pin, math, languniq, hash, mtime_ns, size, scan_version) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", params)
+    post_id = cursor.lastrowid
+
+    db.executemany("INSERT OR IGNORE INTO post_tags (tag, post_id) VALUES (?, ?)",
+        [(tag, post_id) for tag in post_data[fields.TAG_ARR]])
+    db.executemany("INSERT OR IGNORE INTO post_categs (categ, post_id) VALUES (?, ?)",
+        [(categ, post_id) for categ in post_data[fields.CATEG_ARR]])
+    db.executemany("INSERT OR IGNORE INTO post_images (src, post_id) VALUES (?, ?)",
+        [(src, post_id) for src in body_scan.images])
+
+# posts_folders is {lang: PostsData} as collected by gen.py, fields is gen.Field
+# every changed post is expected to have its body scanned already, scan_version is bodyscan.SCAN_VERSION
+def sync_posts(db, posts_folders, scan_version, fields):
+    with db:
+        existing = db.execute("SELECT id, lang, name FROM posts").fetchall()
+        for post_id, lang, name in existing:
+            if lang not in posts_folders or name not in posts_folders[lang].posts:
+                db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+
+        for lang in posts_folders:
+            lang_posts = posts_folders[lang]
+            for name in lang_posts.posts:
+                file_info = lang_posts.file_info[name]
+                if name in lang_posts.body_scans:
+                    write_post(db, lang, name, lang_posts.posts[name], file_info, lang_posts.body_scans[name], scan_version, fields)
+                else:
+                    # content is the same, only stat could be different (touch, checkout)
+                    db.execute("UPDATE posts SET mtime_ns = ?, size = ? WHERE lang = ? AND name = ?",
+                        (file_info.mtime_ns, file_info.size, lang, name))
+
+POST_COLUMNS = "p.lang, p.name, p.date"
+
+def lang_filter(query, params, lang):
+    if lang is not None:
+        query += " AND p.lang = ?"
+        params.append(lang)
+    return query + " ORDER BY p.date_ts DESC, p.lang, p.name"
+
+def query_tag(db, tag, lang=None):
+    query = "SELECT {0} FROM post_tags t JOIN posts p ON p.id = t.post_id WHERE t.tag = ?".format(POST_COLUMNS)
+    params = [tag]
+    return db.execute(lang_filter(query, params, lang), params).fetchall()
+
+def query_categ(db, categ, lang=None):
+    query = "SELECT {0} FROM post_categs c JOIN posts p ON p.id = c.post_id WHERE c.categ = ?".format(POST_COLUMNS)
+    params = [categ]
+    return db.execute(lang_filter(query, params, lang), params).fetchall()
+
+def query_since(db, since, lang=None):
+    query = "SELECT {0} FROM posts p WHERE p.date_ts >= ?".format(POST_COLUMNS)
+    params = [int(since.timestamp())]
+    return db.execute(lang_filter(query, params, lang), params).fetchall()
+
+def query_pinned(db, lang=None):
+    query = "SELECT {0} FROM posts p WHERE p.pin = 1".format(POST_COLUMNS)
+    params = []
+    return db.execute(lang_filter(query, params, lang), params).fetchall()
+
+def query_languniq(db, lang=None):
+    query = "SELECT {0} FROM posts p WHERE p.languniq = 1".format(POST_COLUMNS)
+    params = []
+    return db.execute(lang_filter(query, params, lang), params).fetchall()
+
+def query_tag_counts(db, lang=None):
+    query = "SELECT t.tag, COUNT(*) FROM post_tags t JOIN posts p ON p.id = t.post_id"
+    params = []
+    if lang is not None:
+        query += " WHERE p.lang = ?"
+        params.append(lang)
+    query += " GROUP BY t.tag ORDER BY t.tag"
+    return db.execute(query, params).fetchall()
+
+def query_images(db, lang=None):
+    query = "SELECT i.src, COUNT(*) FROM post_images i JOIN posts p ON p.id = i.post_id"
+    params = []
+    if lang is not None:
+        query += " WHERE p.lang = ?"
+        params.append(lang)
+    query += " GROUP BY i.src ORDER BY i.src"
+    return db.execute(query, params).fetchall()
+
+def parse_since_date(date_str):
+    try:
+        result = datetime.datetime.fromisoformat(date_str)
+    except ValueError:
+        panic("invalid date {0}, expected YYYY-MM-DD[ HH:MM:SS[+HH:MM]]".format(date_str))
+
+    if result.tzinfo is None:
+        result = result.replace(tzinfo=datetime.timezone.utc)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="query post metadata collected by gen.py")
+    parser.add_argument("--db", default=POST_DB_PATH, help="path to the post db")
+    parser.add_argument("--lang", default=None, help="limit result to one language folder")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("tag", help="posts with tag").add_argument("name")
+    sub.add_parser("categ", help="posts with category").add_argument("name")
+    sub.add_parser("since", help="posts dated at or after date").add_argument("date")
+    sub.add_parser("pinned", help="pinned posts")
+    sub.add_parser("languniq", help="posts that exist only in one language")
+    sub.add_parser("tags", help="all tags with post count")
+    sub.add_parser("images", help="all images referenced by posts with post count")
+    args = parser.parse_args()
+
+    db = open_post_db(args.db, create=False)
+
+    if args.cmd == "tags":
+        for tag, count in query_tag_counts(db, args.lang):
+            print("{0}\t{1}".format(tag, count))
+    elif args.cmd == "images":
+        for src, count in query_images(db, args.lang):
+            print("{0}\t{1}".format(src, count))
+    else:
+        if args.cmd == "tag":
+            rows = query_tag(db, args.name, args.lang)
+        elif args.cmd == "categ":
+            rows = query_categ(db, args.name, args.lang)
+        elif args.cmd == "since":
+            rows = query_since(db, parse_since_date(args.date), args.lang)
+        elif args.cmd == "pinned":
+            rows = query_pinned(db, args.lang)
+        else:
+            rows = query_languniq(db, args.lang)
+
+        for lang, name, date in rows:
+            print("{0}/{1}\t{2}".format(lang, name, date))
+
+    db.close()
+
+if __name__ == "__main__":
+    main()